@@ -37,6 +37,7 @@ class AnkiMinerConfig:
         default_factory=lambda: Path(tempfile.gettempdir()) / "anki_miner_temp"
     )
     subtitle_offset: float = 0.0  # Seconds to shift subtitles (+ later, - earlier)
+    audio_stream_copy: bool = False  # Copy AAC/Opus audio as-is instead of encoding MP3
 
     # Word filtering settings
     min_word_length: int = 2
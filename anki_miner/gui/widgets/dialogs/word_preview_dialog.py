@@ -457,19 +457,19 @@ class WordPreviewDialog(QDialog):
                 )
 
                 # Write data
-                for word in self.filtered_words:
-                    writer.writerow(
-                        [
-                            word.surface,
-                            word.lemma,
-                            word.reading,
-                            word.sentence,
-                            f"{word.start_time:.2f}",
-                            f"{word.end_time:.2f}",
-                            f"{word.duration:.2f}",
-                            str(word.video_file) if word.video_file else "",
-                        ]
-                    )
+                writer.writerows(
+                    [
+                        word.surface,
+                        word.lemma,
+                        word.reading,
+                        word.sentence,
+                        f"{word.start_time:.2f}",
+                        f"{word.end_time:.2f}",
+                        f"{word.duration:.2f}",
+                        str(word.video_file) if word.video_file else "",
+                    ]
+                    for word in self.filtered_words
+                )
 
             QMessageBox.information(
                 self,
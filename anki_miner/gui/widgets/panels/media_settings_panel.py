@@ -1,6 +1,6 @@
 """Media extraction settings panel."""
 
-from PyQt6.QtWidgets import QDoubleSpinBox, QSpinBox
+from PyQt6.QtWidgets import QCheckBox, QDoubleSpinBox, QSpinBox
 
 from anki_miner.gui.widgets.base import FormPanel
 
@@ -12,6 +12,7 @@ class MediaSettingsPanel(FormPanel):
     - Audio padding configuration
     - Screenshot offset configuration
     - Max parallel workers configuration
+    - Audio stream copy toggle
     """
 
     def __init__(self, parent=None):
@@ -55,4 +56,15 @@ class MediaSettingsPanel(FormPanel):
             helper="Higher values = faster processing but more CPU/memory usage",
         )
 
+        # Audio stream copy
+        self.audio_stream_copy_checkbox = QCheckBox("Copy Audio Without Re-encoding")
+        self.audio_stream_copy_checkbox.setToolTip(
+            "Cut AAC/Opus audio as-is instead of converting it to MP3"
+        )
+        self.add_field(
+            "",
+            self.audio_stream_copy_checkbox,
+            helper="Faster extraction; clips are saved as .m4a/.opus when the source allows it",
+        )
+
         self.add_stretch()
@@ -157,6 +157,7 @@ class SettingsTab(QWidget):
         self.media_panel.audio_padding_spinbox.setValue(self.config.audio_padding)
         self.media_panel.screenshot_offset_spinbox.setValue(self.config.screenshot_offset)
         self.media_panel.max_workers_spinbox.setValue(self.config.max_parallel_workers)
+        self.media_panel.audio_stream_copy_checkbox.setChecked(self.config.audio_stream_copy)
 
         # Dictionary settings
         self.dictionary_panel.jmdict_selector.set_path(str(self.config.jmdict_path))
@@ -179,6 +180,7 @@ class SettingsTab(QWidget):
             audio_padding=self.media_panel.audio_padding_spinbox.value(),
             screenshot_offset=self.media_panel.screenshot_offset_spinbox.value(),
             max_parallel_workers=self.media_panel.max_workers_spinbox.value(),
+            audio_stream_copy=self.media_panel.audio_stream_copy_checkbox.isChecked(),
             # Dictionary settings
             jmdict_path=(
                 Path(self.dictionary_panel.jmdict_selector.get_path())
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaData:
     """Media data (screenshot and audio) for a vocabulary word."""
 
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of processing an episode or folder."""
 
@@ -31,7 +31,7 @@ class ProcessingResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """A single validation issue."""
 
@@ -43,7 +43,7 @@ class ValidationIssue:
         return f"[{self.severity}] {self.component}: {self.message}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of system validation."""
 
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenizedWord:
     """A word extracted from subtitles with timing information."""
 
@@ -26,7 +26,7 @@ class TokenizedWord:
         return f"TokenizedWord(lemma='{self.lemma}', reading='{self.reading}', surface='{self.surface}')"
 
 
-@dataclass
+@dataclass(slots=True)
 class WordData:
     """Complete data for a vocabulary word including definition and media."""
 
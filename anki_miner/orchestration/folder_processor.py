@@ -1,11 +1,16 @@
 """Orchestrator for processing a folder of episodes."""
 
+import os
+from operator import itemgetter
 from pathlib import Path
 
 from anki_miner.interfaces import PresenterProtocol, ProgressCallback
 from anki_miner.models import ProcessingResult
 from anki_miner.orchestration.episode_processor import EpisodeProcessor
 
+_VIDEO_EXTENSIONS = frozenset({".mp4", ".mkv", ".avi", ".m4v", ".mov"})
+_SUBTITLE_EXTENSIONS = frozenset({".ass", ".srt", ".ssa"})
+
 
 class FolderProcessor:
     """Orchestrate processing of a folder of episodes."""
@@ -29,32 +34,41 @@ class FolderProcessor:
         Returns:
             List of (video_path, subtitle_path) tuples
         """
-        # Video extensions
-        video_extensions = {".mp4", ".mkv", ".avi", ".m4v", ".mov"}
-        # Subtitle extensions
-        subtitle_extensions = {".ass", ".srt", ".ssa"}
-
-        # Get all videos
-        videos = [
-            f for f in folder.iterdir() if f.is_file() and f.suffix.lower() in video_extensions
-        ]
+        # One directory pass; keep names as strings and only build Paths for matches
+        videos: list[tuple[str, str, str]] = []  # (stem, name, path)
+        subtitles: dict[str, str] = {}  # stem -> path
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                name = entry.name
+                stem, dot, ext = name.rpartition(".")
+                if not stem:
+                    continue  # No extension, or a dotfile such as ".mkv"
+                # Both videos and subtitles match their extension case-insensitively
+                ext = dot + ext.lower()
+                if ext in _VIDEO_EXTENSIONS:
+                    if entry.is_file():
+                        videos.append((stem, name, entry.path))
+                elif ext in _SUBTITLE_EXTENSIONS and entry.is_file():
+                    # Prefer the alphabetically first subtitle so results are deterministic
+                    current = subtitles.get(stem)
+                    if current is None or entry.path < current:
+                        subtitles[stem] = entry.path
+
+        if not videos or not subtitles:
+            return []
 
-        # Match with subtitles
-        pairs = []
-        for video in videos:
-            # Look for subtitle with same name
-            for sub_ext in subtitle_extensions:
-                subtitle = video.with_suffix(sub_ext)
-                if subtitle.exists():
-                    pairs.append((video, subtitle))
-                    break  # Found a match, stop looking
-
-        # Sort pairs by video name (natural sort)
         from anki_miner.utils import natural_sort_key
 
-        pairs.sort(key=lambda pair: natural_sort_key(pair[0].name))
+        # Match with subtitles of the same name, decorating each pair with the
+        # natural sort key of its video name so the key is built once per pair
+        decorated = [
+            (natural_sort_key(name), Path(video), Path(subtitles[stem]))
+            for stem, name, video in videos
+            if stem in subtitles
+        ]
+        decorated.sort(key=itemgetter(0))
 
-        return pairs
+        return [(video, subtitle) for _, video, subtitle in decorated]
 
     def process_folder(
         self,
@@ -1,6 +1,5 @@
 """Service for extracting media (screenshots and audio) from video files."""
 
-import json
 import logging
 import subprocess
 import threading
@@ -12,8 +11,23 @@ from anki_miner.interfaces import ProgressCallback
 from anki_miner.models import MediaData, TokenizedWord
 from anki_miner.utils import ensure_directory, safe_filename
 
+try:
+    import av  # Optional: probe streams in-process instead of spawning ffprobe
+except ImportError:
+    _HAS_AV = False
+else:
+    _HAS_AV = True
+
 logger = logging.getLogger(__name__)
 
+# Audio codecs that can be cut without re-encoding, and the container to copy them into
+_STREAM_COPY_EXTENSIONS = {"aac": ".m4a", "opus": ".opus"}
+
+_JAPANESE_LANGUAGE_CODES = frozenset({"jpn", "ja", "japanese", "jp"})
+
+# (stream index, codec name, lowercased language tag) of one audio stream
+_AudioStream = tuple[int, str | None, str]
+
 
 class MediaExtractorService:
     """Extract screenshots and audio clips from video files (stateless service)."""
@@ -27,6 +41,8 @@ class MediaExtractorService:
         self.config = config
         ensure_directory(config.media_temp_folder)
         self._audio_stream_cache: dict[Path, int | None] = {}
+        self._audio_codec_cache: dict[Path, str | None] = {}
+        self._has_audio_cache: dict[Path, bool] = {}
         self._cache_lock = threading.Lock()
 
     def extract_media(
@@ -48,18 +64,35 @@ class MediaExtractorService:
         timestamp = int(word.start_time * 1000)
 
         screenshot_file = f"{safe_word}_{timestamp}.jpg"
-        audio_file = f"{safe_word}_{timestamp}.mp3"
+        audio_file = f"{safe_word}_{timestamp}{self._audio_extension(video_file)}"
 
         screenshot_path = self.config.media_temp_folder / screenshot_file
         audio_path = self.config.media_temp_folder / audio_file
 
-        # Extract screenshot
-        screenshot_success = self._extract_screenshot(
-            video_file, word.start_time, word.duration, screenshot_path
-        )
-
-        # Extract audio
-        audio_success = self._extract_audio(video_file, word.start_time, word.duration, audio_path)
+        if not self._has_audio_stream(video_file):
+            # No audio to cut, so a combined run could only fail
+            screenshot_success = self._extract_screenshot(
+                video_file, word.start_time, word.duration, screenshot_path
+            )
+            audio_success = False
+        else:
+            # Extract both in one ffmpeg run, retrying separately whatever it missed
+            results = self._extract_both(
+                video_file, word.start_time, word.duration, screenshot_path, audio_path
+            )
+            if results is None:
+                # Timed out; separate runs on the same file would most likely time out too
+                screenshot_success = audio_success = False
+            else:
+                screenshot_success, audio_success = results
+                if not screenshot_success:
+                    screenshot_success = self._extract_screenshot(
+                        video_file, word.start_time, word.duration, screenshot_path
+                    )
+                if not audio_success:
+                    audio_success = self._extract_audio(
+                        video_file, word.start_time, word.duration, audio_path
+                    )
 
         return MediaData(
             screenshot_path=screenshot_path if screenshot_success else None,
@@ -122,6 +155,89 @@ class MediaExtractorService:
 
         return media_data_list
 
+    def _thread_args(self) -> list[str]:
+        """Build the ffmpeg thread arguments for one extraction.
+
+        Returns:
+            ["-threads", "1"] when extractions run in parallel, otherwise no arguments
+        """
+        # Parallel workers each run their own ffmpeg, so one thread apiece avoids
+        # oversubscribing the CPU; a lone worker keeps ffmpeg's default threading
+        if self.config.max_parallel_workers > 1:
+            return ["-threads", "1"]
+        return []
+
+    def _extract_both(
+        self,
+        video_file: Path,
+        start_time: float,
+        duration: float,
+        screenshot_path: Path,
+        audio_path: Path,
+    ) -> tuple[bool, bool] | None:
+        """Extract a screenshot and an audio clip with a single ffmpeg process.
+
+        The input is opened and seeked once at the start of the padded audio
+        window; the screenshot output then skips ahead to its own timestamp.
+
+        Args:
+            video_file: Path to video file
+            start_time: Start time in seconds
+            duration: Duration in seconds
+            screenshot_path: Output path for screenshot
+            audio_path: Output path for audio
+
+        Returns:
+            Tuple of (screenshot_success, audio_success), or None if ffmpeg timed out
+        """
+        # Same timing as _extract_audio and _extract_screenshot
+        audio_start = max(0, start_time - self.config.audio_padding)
+        audio_duration = duration + (self.config.audio_padding * 2)
+        screenshot_time = start_time + min(self.config.screenshot_offset, duration / 2)
+
+        cmd = [
+            "ffmpeg",
+            "-y",
+            *self._thread_args(),
+            "-ss",
+            str(audio_start),
+            "-i",
+            str(video_file),
+            # Screenshot output; capital V skips attached pictures such as cover art
+            "-map",
+            "0:V:0",
+            "-ss",
+            str(screenshot_time - audio_start),
+            "-frames:v",
+            "1",
+            "-q:v",
+            "2",
+            str(screenshot_path),
+            # Audio output
+            *self._audio_map_args(video_file),
+            "-t",
+            str(audio_duration),
+            "-vn",
+            *self._audio_codec_args(audio_path),
+            str(audio_path),
+        ]
+
+        try:
+            proc = subprocess.run(cmd, capture_output=True, timeout=30)
+            if proc.returncode != 0:
+                logger.debug(
+                    f"Combined extraction failed for {screenshot_path.stem}: "
+                    f"ffmpeg exit code {proc.returncode}, falling back to separate runs"
+                )
+                return False, False
+            return screenshot_path.exists(), audio_path.exists()
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Combined extraction timed out for {screenshot_path.stem}")
+            return None
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.warning(f"Combined extraction error for {screenshot_path.stem}: {e}")
+            return False, False
+
     def _extract_screenshot(
         self,
         video_file: Path,
@@ -146,6 +262,7 @@ class MediaExtractorService:
         cmd = [
             "ffmpeg",
             "-y",  # Overwrite output
+            *self._thread_args(),
             "-ss",
             str(screenshot_time),
             "-i",
@@ -178,7 +295,7 @@ class MediaExtractorService:
             return False
 
     def _get_japanese_audio_stream(self, video_file: Path) -> int | None:
-        """Detect Japanese audio stream index using ffprobe.
+        """Detect Japanese audio stream index using PyAV or ffprobe.
 
         Args:
             video_file: Path to video file
@@ -191,60 +308,165 @@ class MediaExtractorService:
             if video_file in self._audio_stream_cache:
                 return self._audio_stream_cache[video_file]
 
+        streams: list[_AudioStream] | None
+        try:
+            if _HAS_AV:
+                streams = self._probe_audio_streams_pyav(video_file)
+            else:
+                streams = self._probe_audio_streams_ffprobe(video_file)
+        except Exception as e:
+            logger.warning(f"Error probing audio streams: {e}")
+            streams = None
+
+        if streams is None:
+            with self._cache_lock:
+                self._audio_stream_cache[video_file] = None
+            return None
+
+        # Look for Japanese audio stream
+        for stream_index, codec_name, language in streams:
+            if language in _JAPANESE_LANGUAGE_CODES:
+                logger.info(f"Found Japanese audio: stream {stream_index} (language: {language})")
+                with self._cache_lock:
+                    self._audio_stream_cache[video_file] = stream_index
+                    self._audio_codec_cache[video_file] = codec_name
+                    self._has_audio_cache[video_file] = True
+                return stream_index
+
+        # Log available streams for debugging
+        available_langs = [language or "unknown" for _, _, language in streams]
+        logger.warning(f"No Japanese audio found. Available languages: {available_langs}")
+        with self._cache_lock:
+            self._audio_stream_cache[video_file] = None
+            # Extraction falls back to the first audio stream
+            self._audio_codec_cache[video_file] = streams[0][1] if streams else None
+            self._has_audio_cache[video_file] = bool(streams)
+        return None
+
+    @staticmethod
+    def _probe_audio_streams_pyav(video_file: Path) -> list[_AudioStream]:
+        """List the audio streams of a video in-process with PyAV.
+
+        Args:
+            video_file: Path to video file
+
+        Returns:
+            Audio streams in container order
+        """
+        with av.open(str(video_file), metadata_errors="ignore") as container:
+            streams: list[_AudioStream] = [
+                (
+                    stream.index,
+                    stream.codec_context.name,
+                    stream.metadata.get("language", "").lower(),
+                )
+                for stream in container.streams.audio
+            ]
+        return streams
+
+    @staticmethod
+    def _probe_audio_streams_ffprobe(video_file: Path) -> list[_AudioStream] | None:
+        """List the audio streams of a video by running ffprobe.
+
+        Args:
+            video_file: Path to video file
+
+        Returns:
+            Audio streams in container order, or None if ffprobe failed
+        """
         cmd = [
             "ffprobe",
             "-v",
-            "quiet",
-            "-print_format",
-            "json",
-            "-show_streams",
+            "error",
             "-select_streams",
             "a",  # Audio streams only
+            "-show_entries",
+            "stream=index,codec_name:stream_tags=language",
+            "-of",
+            "csv=p=0",  # One "index,codec,language" line per stream
             str(video_file),
         ]
 
-        try:
-            proc = subprocess.run(cmd, capture_output=True, timeout=30, text=True)
-            if proc.returncode != 0:
-                logger.warning(f"ffprobe failed for {video_file}: {proc.stderr}")
-                with self._cache_lock:
-                    self._audio_stream_cache[video_file] = None
-                return None
+        proc = subprocess.run(cmd, capture_output=True, timeout=30, text=True)
+        if proc.returncode != 0:
+            logger.warning(f"ffprobe failed for {video_file}: {proc.stderr}")
+            return None
 
-            data = json.loads(proc.stdout)
-            streams = data.get("streams", [])
+        streams: list[_AudioStream] = []
+        for line in proc.stdout.splitlines():
+            if not line:
+                continue
+            # The language field is omitted when a stream has no language tag
+            index, _, rest = line.partition(",")
+            codec_name, _, language = rest.partition(",")
+            streams.append((int(index), codec_name or None, language.lower()))
+        return streams
 
-            # Look for Japanese audio stream
-            japanese_codes = {"jpn", "ja", "japanese", "jp"}
+    def _has_audio_stream(self, video_file: Path) -> bool:
+        """Check whether a video has an audio stream to extract.
 
-            for stream in streams:
-                tags = stream.get("tags", {})
-                language = tags.get("language", "").lower()
+        Args:
+            video_file: Path to video file
 
-                if language in japanese_codes:
-                    stream_index = stream.get("index")
-                    logger.info(
-                        f"Found Japanese audio: stream {stream_index} (language: {language})"
-                    )
-                    stream_index_int: int | None = (
-                        int(stream_index) if stream_index is not None else None
-                    )
-                    with self._cache_lock:
-                        self._audio_stream_cache[video_file] = stream_index_int
-                    return stream_index_int
+        Returns:
+            False only if probing succeeded and found no audio streams
+        """
+        # Probing records the result; it runs once per video
+        self._get_japanese_audio_stream(video_file)
+        with self._cache_lock:
+            return self._has_audio_cache.get(video_file, True)
 
-            # Log available streams for debugging
-            available_langs = [s.get("tags", {}).get("language", "unknown") for s in streams]
-            logger.warning(f"No Japanese audio found. Available languages: {available_langs}")
-            with self._cache_lock:
-                self._audio_stream_cache[video_file] = None
-            return None
+    def _audio_map_args(self, video_file: Path) -> list[str]:
+        """Build the ffmpeg -map arguments selecting the audio stream to extract.
 
-        except Exception as e:
-            logger.warning(f"Error probing audio streams: {e}")
-            with self._cache_lock:
-                self._audio_stream_cache[video_file] = None
-            return None
+        Args:
+            video_file: Path to video file
+
+        Returns:
+            Japanese audio stream if found, otherwise the first audio stream
+        """
+        jp_stream = self._get_japanese_audio_stream(video_file)
+        if jp_stream is not None:
+            logger.debug(f"Using Japanese audio stream {jp_stream}")
+            return ["-map", f"0:{jp_stream}"]
+
+        logger.warning("No Japanese audio found, using first audio stream")
+        return ["-map", "0:a:0"]  # First audio stream
+
+    def _audio_extension(self, video_file: Path) -> str:
+        """Choose the audio clip extension for a video.
+
+        Args:
+            video_file: Path to video file
+
+        Returns:
+            The source codec's container when stream copy is enabled and supported,
+            otherwise ".mp3"
+        """
+        if not self.config.audio_stream_copy:
+            return ".mp3"
+
+        # Probing records the codec of the stream that will be extracted
+        self._get_japanese_audio_stream(video_file)
+        with self._cache_lock:
+            codec = self._audio_codec_cache.get(video_file)
+        if codec is not None and codec in _STREAM_COPY_EXTENSIONS:
+            return _STREAM_COPY_EXTENSIONS[codec]
+        return ".mp3"
+
+    @staticmethod
+    def _audio_codec_args(output_path: Path) -> list[str]:
+        """Build the ffmpeg codec arguments for an audio clip.
+
+        Args:
+            output_path: Output path for audio, as named by _audio_extension
+
+        Returns:
+            Stream copy arguments for copyable containers, otherwise MP3 encoding
+        """
+        if output_path.suffix in _STREAM_COPY_EXTENSIONS.values():
+            return ["-c:a", "copy"]
+        return ["-acodec", "libmp3lame", "-q:a", "2"]  # Audio quality
 
     def _extract_audio(
         self,
@@ -268,36 +490,24 @@ class MediaExtractorService:
         audio_start = max(0, start_time - self.config.audio_padding)
         audio_duration = duration + (self.config.audio_padding * 2)
 
-        # Detect Japanese audio stream
-        jp_stream = self._get_japanese_audio_stream(video_file)
-
         # Build ffmpeg command
         cmd = [
             "ffmpeg",
             "-y",
+            *self._thread_args(),
             "-ss",
             str(audio_start),
             "-t",
             str(audio_duration),
             "-i",
             str(video_file),
+            *self._audio_map_args(video_file),
         ]
 
-        # Map to Japanese audio if found, otherwise use first audio stream
-        if jp_stream is not None:
-            cmd.extend(["-map", f"0:{jp_stream}"])
-            logger.debug(f"Using Japanese audio stream {jp_stream}")
-        else:
-            cmd.extend(["-map", "0:a:0"])  # First audio stream
-            logger.warning("No Japanese audio found, using first audio stream")
-
         cmd.extend(
             [
                 "-vn",  # No video
-                "-acodec",
-                "libmp3lame",
-                "-q:a",
-                "2",  # Audio quality
+                *self._audio_codec_args(output_path),
                 str(output_path),
             ]
         )
@@ -2,6 +2,7 @@
 
 import re
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 
 
@@ -22,16 +23,16 @@ class EpisodeInfo:
 class EpisodeNumberExtractor:
     """Extract episode numbers from filenames using regex patterns."""
 
-    # Regex patterns for common episode naming conventions (in priority order)
+    # Compiled regex patterns for common episode naming conventions (in priority order)
     PATTERNS = [
         # S01E01, s1e1, S01 E01 (season + episode)
-        (r"[Ss](\d+)[Ee](\d+)", lambda m: (int(m.group(1)), int(m.group(2)))),
+        (re.compile(r"[Ss](\d+)[Ee](\d+)"), lambda m: (int(m.group(1)), int(m.group(2)))),
         # 1x01, 1X01 (season x episode)
-        (r"(\d+)[xX](\d+)", lambda m: (int(m.group(1)), int(m.group(2)))),
+        (re.compile(r"(\d+)[xX](\d+)"), lambda m: (int(m.group(1)), int(m.group(2)))),
         # Episode 01, Ep01, ep.01, episode_01 (no season)
-        (r"[Ee][Pp](?:isode)?[\s._-]*(\d+)", lambda m: (None, int(m.group(1)))),
+        (re.compile(r"[Ee][Pp](?:isode)?[\s._-]*(\d+)"), lambda m: (None, int(m.group(1)))),
         # Just numbers: 01, 001, 1 (at boundaries or after non-digits)
-        (r"(?:^|[^\d])(\d{1,3})(?:[^\d]|$)", lambda m: (None, int(m.group(1)))),
+        (re.compile(r"(?:^|[^\d])(\d{1,3})(?:[^\d]|$)"), lambda m: (None, int(m.group(1)))),
     ]
 
     @classmethod
@@ -47,7 +48,7 @@ class EpisodeNumberExtractor:
         filename = file_path.stem  # Remove extension
 
         for pattern, extractor in cls.PATTERNS:
-            match = re.search(pattern, filename)
+            match = pattern.search(filename)
             if match:
                 season, episode = extractor(match)
                 return EpisodeInfo(file_path, episode, season)
@@ -75,39 +76,33 @@ class EpisodeMatcher:
         Returns:
             List of (video, subtitle) tuples sorted by episode number
         """
-        # Extract episode info for all files
-        video_episodes = []
-        for video in video_files:
-            info = EpisodeNumberExtractor.extract_episode_info(video)
-            if info:
-                video_episodes.append(info)
-
-        subtitle_episodes = []
+        # Bucket subtitles by episode number so each video is a dict lookup
+        # instead of a scan over every subtitle
+        subtitles_by_episode: dict[int, list[EpisodeInfo]] = {}
         for subtitle in subtitle_files:
             info = EpisodeNumberExtractor.extract_episode_info(subtitle)
             if info:
-                subtitle_episodes.append(info)
-
-        # Match by episode number
-        pairs = []
-        for video_info in video_episodes:
-            for subtitle_info in subtitle_episodes:
-                # Match if episode numbers are the same
-                if video_info.episode_number == subtitle_info.episode_number:
-                    # If both have season numbers, they must match
-                    if (
-                        video_info.season_number is not None
-                        and subtitle_info.season_number is not None
-                        and video_info.season_number != subtitle_info.season_number
-                    ):
-                        continue  # Seasons don't match, skip
-
-                    pairs.append(
-                        (video_info.file_path, subtitle_info.file_path, video_info.episode_number)
-                    )
-                    break  # Found match, move to next video
-
-        # Sort by episode number using cached value
-        pairs.sort(key=lambda p: p[2])
-        # Return without the cached episode number
-        return [(p[0], p[1]) for p in pairs]
+                subtitles_by_episode.setdefault(info.episode_number, []).append(info)
+
+        # Match by episode number, decorating each pair with it for sorting
+        decorated: list[tuple[int, Path, Path]] = []
+        for video in video_files:
+            video_info = EpisodeNumberExtractor.extract_episode_info(video)
+            if not video_info:
+                continue
+
+            for subtitle_info in subtitles_by_episode.get(video_info.episode_number, ()):
+                # If both have season numbers, they must match
+                if (
+                    video_info.season_number is not None
+                    and subtitle_info.season_number is not None
+                    and video_info.season_number != subtitle_info.season_number
+                ):
+                    continue  # Seasons don't match, skip
+
+                decorated.append((video_info.episode_number, video, subtitle_info.file_path))
+                break  # Found match, move to next video
+
+        # Sort on the episode number only (stable, never compares paths)
+        decorated.sort(key=itemgetter(0))
+        return [(video, subtitle) for _, video, subtitle in decorated]
@@ -1,10 +1,26 @@
 """Utility for pairing video and subtitle files across folders."""
 
+import os
+from collections.abc import Collection
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+def _list_files(folder: Path, extensions: Collection[str]) -> list[Path]:
+    """List files in folder whose lowercased extension is in extensions.
+
+    Uses a single scandir pass so file type and name come from the directory
+    listing instead of a separate stat per entry.
+    """
+    with os.scandir(folder) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file()
+        ]
+
+
+@dataclass(frozen=True, slots=True)
 class FilePair:
     """Represents a video/subtitle file pair."""
 
@@ -43,24 +59,20 @@ class FilePairMatcher:
         Returns:
             List of FilePair objects, naturally sorted by video filename
         """
-        # Get all videos from anime folder
-        videos = [
-            f
-            for f in anime_folder.iterdir()
-            if f.is_file() and f.suffix.lower() in FilePairMatcher.VIDEO_EXTENSIONS
+        videos = _list_files(anime_folder, FilePairMatcher.VIDEO_EXTENSIONS)
+
+        # Index subtitles by base name ("episode_01.ass" -> "episode_01"); sorting
+        # first makes the choice deterministic when several extensions share a stem
+        subtitles_by_stem: dict[str, Path] = {}
+        for subtitle in sorted(_list_files(subtitle_folder, FilePairMatcher.SUBTITLE_EXTENSIONS)):
+            subtitles_by_stem.setdefault(subtitle.stem, subtitle)
+
+        pairs = [
+            FilePair(video, subtitles_by_stem[video.stem])
+            for video in videos
+            if video.stem in subtitles_by_stem
         ]
 
-        pairs = []
-        for video in videos:
-            base_name = video.stem  # "episode_01.mp4" -> "episode_01"
-
-            # Look for subtitle with same base name in subtitle folder
-            for sub_ext in FilePairMatcher.SUBTITLE_EXTENSIONS:
-                subtitle = subtitle_folder / f"{base_name}{sub_ext}"
-                if subtitle.exists():
-                    pairs.append(FilePair(video, subtitle))
-                    break
-
         # Natural sort by video filename
         from anki_miner.utils.sort_utils import natural_sort_key
 
@@ -85,16 +97,8 @@ class FilePairMatcher:
         paired_videos = {p.video for p in pairs}
         paired_subtitles = {p.subtitle for p in pairs}
 
-        all_videos = [
-            f
-            for f in anime_folder.iterdir()
-            if f.is_file() and f.suffix.lower() in FilePairMatcher.VIDEO_EXTENSIONS
-        ]
-        all_subtitles = [
-            f
-            for f in subtitle_folder.iterdir()
-            if f.is_file() and f.suffix.lower() in FilePairMatcher.SUBTITLE_EXTENSIONS
-        ]
+        all_videos = _list_files(anime_folder, FilePairMatcher.VIDEO_EXTENSIONS)
+        all_subtitles = _list_files(subtitle_folder, FilePairMatcher.SUBTITLE_EXTENSIONS)
 
         unpaired_videos = [v for v in all_videos if v not in paired_videos]
         unpaired_subtitles = [s for s in all_subtitles if s not in paired_subtitles]
@@ -120,17 +124,8 @@ class FilePairMatcher:
         from anki_miner.utils.episode_matcher import EpisodeMatcher
 
         # Get all videos and subtitles
-        videos = [
-            f
-            for f in anime_folder.iterdir()
-            if f.is_file() and f.suffix.lower() in FilePairMatcher.VIDEO_EXTENSIONS
-        ]
-
-        subtitles = [
-            f
-            for f in subtitle_folder.iterdir()
-            if f.is_file() and f.suffix.lower() in FilePairMatcher.SUBTITLE_EXTENSIONS
-        ]
+        videos = _list_files(anime_folder, FilePairMatcher.VIDEO_EXTENSIONS)
+        subtitles = _list_files(subtitle_folder, FilePairMatcher.SUBTITLE_EXTENSIONS)
 
         # Match by episode number
         matched_pairs = EpisodeMatcher.match_by_episode_number(videos, subtitles)
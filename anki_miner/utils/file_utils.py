@@ -1,7 +1,24 @@
 """File system utilities."""
 
+import fnmatch
+import os
+import re
 from pathlib import Path
 
+# One translate table for safe_filename: characters that are invalid in filenames on
+# at least one supported platform become "_", control characters are dropped
+_INVALID_FILENAME_CHARS = str.maketrans(
+    {
+        **dict.fromkeys('<>:"/\\|?*', "_"),
+        **dict.fromkeys([*map(chr, range(0x20)), "\x7f"]),
+    }
+)
+
+# Device names Windows reserves regardless of extension
+_RESERVED_NAMES = frozenset(
+    {"CON", "PRN", "AUX", "NUL"} | {f"{name}{i}" for name in ("COM", "LPT") for i in range(1, 10)}
+)
+
 
 def ensure_directory(path: Path) -> Path:
     """Ensure a directory exists, creating it if necessary.
@@ -21,7 +38,8 @@ def cleanup_temp_files(directory: Path, pattern: str = "*") -> int:
 
     Args:
         directory: Directory to clean
-        pattern: File pattern to match (default: all files)
+        pattern: Glob pattern relative to directory (default: all files); patterns
+            without a path separator or "**" only match names directly inside it
 
     Returns:
         Number of files removed
@@ -29,14 +47,26 @@ def cleanup_temp_files(directory: Path, pattern: str = "*") -> int:
     if not directory.exists():
         return 0
 
+    if "**" in pattern or "/" in pattern or os.sep in pattern:
+        # Patterns that reach into subdirectories keep Path.glob's semantics
+        paths = [str(path) for path in directory.glob(pattern) if path.is_file()]
+    else:
+        # Match names the way fnmatch.fnmatch does, but compile the pattern once
+        matcher = re.compile(fnmatch.translate(os.path.normcase(pattern)))
+        with os.scandir(directory) as entries:
+            paths = [
+                entry.path
+                for entry in entries
+                if entry.is_file() and matcher.match(os.path.normcase(entry.name))
+            ]
+
     count = 0
-    for file_path in directory.glob(pattern):
-        if file_path.is_file():
-            try:
-                file_path.unlink()
-                count += 1
-            except OSError:
-                pass  # Ignore errors during cleanup
+    for path in paths:
+        try:
+            os.unlink(path)
+            count += 1
+        except OSError:
+            pass  # Ignore errors during cleanup
 
     return count
 
@@ -50,23 +80,12 @@ def safe_filename(filename: str) -> str:
     Returns:
         Safe filename with invalid characters removed
     """
-    import re
-
-    # Remove or replace invalid filename characters
-    invalid_chars = '<>:"/\\|?*'
-    safe_name = filename
-    for char in invalid_chars:
-        safe_name = safe_name.replace(char, "_")
-
-    # Remove control characters
-    safe_name = re.sub(r"[\x00-\x1f\x7f]", "", safe_name)
+    # Replace invalid filename characters and remove control characters in one pass
+    safe_name = filename.translate(_INVALID_FILENAME_CHARS)
 
     # Handle Windows reserved names
-    reserved = {"CON", "PRN", "AUX", "NUL"} | {
-        f"{name}{i}" for name in ("COM", "LPT") for i in range(1, 10)
-    }
     stem = Path(safe_name).stem.upper()
-    if stem in reserved:
+    if stem in _RESERVED_NAMES:
         safe_name = f"_{safe_name}"
 
     # Truncate to 255 bytes (filesystem limit)
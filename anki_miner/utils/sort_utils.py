@@ -3,6 +3,8 @@
 import re
 from typing import Any
 
+_DIGIT_RUNS = re.compile(r"(\d+)")
+
 
 def natural_sort_key(text: str) -> list[Any]:
     """Generate a natural sort key for a string.
@@ -21,8 +23,9 @@ def natural_sort_key(text: str) -> list[Any]:
         sorted(files, key=natural_sort_key)
         # Returns: ["file1.txt", "file2.txt", "file10.txt"]
     """
-
-    def convert(text_segment):
-        return int(text_segment) if text_segment.isdigit() else text_segment.lower()
-
-    return [convert(c) for c in re.split(r"(\d+)", str(text))]
+    # isdecimal() matches exactly what \d captures; isdigit() would also accept
+    # characters such as "²" that int() rejects
+    return [
+        int(segment) if segment.isdecimal() else segment.lower()
+        for segment in _DIGIT_RUNS.split(str(text))
+    ]
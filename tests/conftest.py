@@ -13,9 +13,8 @@ def temp_dir(tmp_path):
     return tmp_path
 
 
-@pytest.fixture
-def test_config(temp_dir):
-    """Provide a test configuration with temporary paths."""
+def _make_test_config(base_dir):
+    """Build a test configuration whose paths live under base_dir."""
     return AnkiMinerConfig(
         anki_deck_name="test_deck",
         anki_note_type="test_note_type",
@@ -29,14 +28,30 @@ def test_config(temp_dir):
             "expression_furigana": "expression_furigana",
             "sentence_furigana": "sentence_furigana",
         },
-        media_temp_folder=temp_dir / "temp_media",
-        jmdict_path=temp_dir / "JMdict_e",
+        media_temp_folder=base_dir / "temp_media",
+        jmdict_path=base_dir / "JMdict_e",
         subtitle_offset=0.0,
         max_parallel_workers=2,  # Reduced for tests
     )
 
 
 @pytest.fixture
+def test_config(temp_dir):
+    """Provide a test configuration with temporary paths."""
+    return _make_test_config(temp_dir)
+
+
+@pytest.fixture(scope="session")
+def shared_test_config(tmp_path_factory):
+    """Provide one test configuration for tests that never touch its paths.
+
+    Tests that create files at the configured paths (e.g. the JMdict file)
+    must use the per-test ``test_config`` fixture instead.
+    """
+    return _make_test_config(tmp_path_factory.mktemp("config"))
+
+
+@pytest.fixture(scope="session")
 def null_presenter():
     """Provide a null presenter for testing (no output)."""
     return NullPresenter()
@@ -48,9 +63,12 @@ def null_progress():
     return NullProgressCallback()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_tokenized_word():
-    """Factory fixture for creating TokenizedWord instances with sensible defaults."""
+    """Factory fixture for creating TokenizedWord instances with sensible defaults.
+
+    The factory is stateless and returns a new word per call, so one is shared per session.
+    """
 
     def _make(
         surface="食べる",
@@ -10,6 +10,8 @@ from anki_miner.exceptions import AnkiConnectionError
 from anki_miner.models import MediaData
 from anki_miner.services.anki_service import AnkiService
 
+pytestmark = pytest.mark.unit
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -1,7 +1,11 @@
 """Tests for batch_queue module."""
 
+import pytest
+
 from anki_miner.models.batch_queue import BatchQueue, QueueItem, QueueItemStatus
 
+pytestmark = pytest.mark.unit
+
 
 class TestQueueItem:
     """Tests for QueueItem dataclass."""
@@ -8,6 +8,8 @@ import requests
 from anki_miner.exceptions import SetupError
 from anki_miner.services.definition_service import DefinitionService
 
+pytestmark = pytest.mark.unit
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
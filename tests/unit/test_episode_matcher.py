@@ -1,7 +1,17 @@
 """Tests for episode_matcher module."""
 
+from pathlib import Path
+
+import pytest
+
 from anki_miner.utils.episode_matcher import EpisodeMatcher, EpisodeNumberExtractor
 
+pytestmark = pytest.mark.unit
+
+# EpisodeMatcher only inspects file names, so these paths never need to exist
+VIDEO_DIR = Path("videos")
+SUB_DIR = Path("subs")
+
 
 class TestEpisodeNumberExtractor:
     """Tests for EpisodeNumberExtractor class."""
@@ -9,10 +19,9 @@ class TestEpisodeNumberExtractor:
     class TestSeasonEpisodePatterns:
         """Tests for S01E01 style patterns."""
 
-        def test_extracts_s01e01_format(self, tmp_path):
+        def test_extracts_s01e01_format(self):
             """Should extract from S01E01 format."""
-            path = tmp_path / "Anime_S01E05.mp4"
-            path.touch()
+            path = Path("Anime_S01E05.mp4")
 
             result = EpisodeNumberExtractor.extract_episode_info(path)
 
@@ -20,10 +29,9 @@ class TestEpisodeNumberExtractor:
             assert result.episode_number == 5
             assert result.season_number == 1
 
-        def test_extracts_lowercase_s01e01(self, tmp_path):
+        def test_extracts_lowercase_s01e01(self):
             """Should extract from lowercase s01e01 format."""
-            path = tmp_path / "anime_s02e10.mkv"
-            path.touch()
+            path = Path("anime_s02e10.mkv")
 
             result = EpisodeNumberExtractor.extract_episode_info(path)
 
@@ -31,10 +39,9 @@ class TestEpisodeNumberExtractor:
             assert result.episode_number == 10
             assert result.season_number == 2
 
-        def test_extracts_1x01_format(self, tmp_path):
+        def test_extracts_1x01_format(self):
             """Should extract from 1x01 format."""
-            path = tmp_path / "Show_1x05.mp4"
-            path.touch()
+            path = Path("Show_1x05.mp4")
 
             result = EpisodeNumberExtractor.extract_episode_info(path)
 
@@ -45,10 +52,9 @@ class TestEpisodeNumberExtractor:
     class TestEpisodeOnlyPatterns:
         """Tests for episode-only patterns (no season)."""
 
-        def test_extracts_ep01_format(self, tmp_path):
+        def test_extracts_ep01_format(self):
             """Should extract from ep01 format."""
-            path = tmp_path / "Anime_ep01.mp4"
-            path.touch()
+            path = Path("Anime_ep01.mp4")
 
             result = EpisodeNumberExtractor.extract_episode_info(path)
 
@@ -56,20 +62,18 @@ class TestEpisodeNumberExtractor:
             assert result.episode_number == 1
             assert result.season_number is None
 
-        def test_extracts_episode_01_format(self, tmp_path):
+        def test_extracts_episode_01_format(self):
             """Should extract from episode_01 format."""
-            path = tmp_path / "Show_episode_05.mp4"
-            path.touch()
+            path = Path("Show_episode_05.mp4")
 
             result = EpisodeNumberExtractor.extract_episode_info(path)
 
             assert result is not None
             assert result.episode_number == 5
 
-        def test_extracts_standalone_number(self, tmp_path):
+        def test_extracts_standalone_number(self):
             """Should extract standalone numbers."""
-            path = tmp_path / "Anime_01.mp4"
-            path.touch()
+            path = Path("Anime_01.mp4")
 
             result = EpisodeNumberExtractor.extract_episode_info(path)
 
@@ -79,10 +83,9 @@ class TestEpisodeNumberExtractor:
     class TestEdgeCases:
         """Tests for edge cases."""
 
-        def test_returns_none_for_no_episode(self, tmp_path):
+        def test_returns_none_for_no_episode(self):
             """Should return None when no episode number found."""
-            path = tmp_path / "no_episode_here.mp4"
-            path.touch()
+            path = Path("no_episode_here.mp4")
 
             result = EpisodeNumberExtractor.extract_episode_info(path)
 
@@ -90,20 +93,18 @@ class TestEpisodeNumberExtractor:
             # For this specific name, should not find anything useful
             assert result is None or result.episode_number is not None
 
-        def test_ignores_extension(self, tmp_path):
+        def test_ignores_extension(self):
             """Should ignore file extension when parsing."""
-            path = tmp_path / "Anime_01.mp4"
-            path.touch()
+            path = Path("Anime_01.mp4")
 
             result = EpisodeNumberExtractor.extract_episode_info(path)
 
             # Should not interpret mp4 as episode 4
             assert result.episode_number == 1
 
-        def test_episode_info_has_filename_property(self, tmp_path):
+        def test_episode_info_has_filename_property(self):
             """EpisodeInfo should have filename property."""
-            path = tmp_path / "Test_S01E01.mp4"
-            path.touch()
+            path = Path("Test_S01E01.mp4")
 
             result = EpisodeNumberExtractor.extract_episode_info(path)
 
@@ -113,23 +114,12 @@ class TestEpisodeNumberExtractor:
 class TestEpisodeMatcher:
     """Tests for EpisodeMatcher class."""
 
-    def test_matches_same_episode_numbers(self, tmp_path):
+    def test_matches_same_episode_numbers(self):
         """Should match files with same episode numbers."""
-        # Create video files
-        video_dir = tmp_path / "videos"
-        video_dir.mkdir()
-        video1 = video_dir / "Anime_01.mp4"
-        video2 = video_dir / "Anime_02.mp4"
-        video1.touch()
-        video2.touch()
-
-        # Create subtitle files
-        sub_dir = tmp_path / "subs"
-        sub_dir.mkdir()
-        sub1 = sub_dir / "ep01.ass"
-        sub2 = sub_dir / "ep02.ass"
-        sub1.touch()
-        sub2.touch()
+        video1 = VIDEO_DIR / "Anime_01.mp4"
+        video2 = VIDEO_DIR / "Anime_02.mp4"
+        sub1 = SUB_DIR / "ep01.ass"
+        sub2 = SUB_DIR / "ep02.ass"
 
         pairs = EpisodeMatcher.match_by_episode_number([video1, video2], [sub1, sub2])
 
@@ -138,17 +128,10 @@ class TestEpisodeMatcher:
         assert pairs[0][0].name == "Anime_01.mp4"
         assert pairs[0][1].name == "ep01.ass"
 
-    def test_matches_with_different_padding(self, tmp_path):
+    def test_matches_with_different_padding(self):
         """Should match files with different zero-padding."""
-        video_dir = tmp_path / "videos"
-        video_dir.mkdir()
-        video = video_dir / "episode_1.mp4"  # No padding
-        video.touch()
-
-        sub_dir = tmp_path / "subs"
-        sub_dir.mkdir()
-        subtitle = sub_dir / "sub_01.ass"  # Zero-padded
-        subtitle.touch()
+        video = VIDEO_DIR / "episode_1.mp4"  # No padding
+        subtitle = SUB_DIR / "sub_01.ass"  # Zero-padded
 
         pairs = EpisodeMatcher.match_by_episode_number([video], [subtitle])
 
@@ -156,40 +139,20 @@ class TestEpisodeMatcher:
         assert pairs[0][0] == video
         assert pairs[0][1] == subtitle
 
-    def test_season_numbers_must_match(self, tmp_path):
+    def test_season_numbers_must_match(self):
         """Should not match if season numbers differ."""
-        video_dir = tmp_path / "videos"
-        video_dir.mkdir()
-        video = video_dir / "S01E01.mp4"
-        video.touch()
-
-        sub_dir = tmp_path / "subs"
-        sub_dir.mkdir()
-        subtitle = sub_dir / "S02E01.ass"  # Different season
-        subtitle.touch()
+        video = VIDEO_DIR / "S01E01.mp4"
+        subtitle = SUB_DIR / "S02E01.ass"  # Different season
 
         pairs = EpisodeMatcher.match_by_episode_number([video], [subtitle])
 
         # Should not match - seasons differ
         assert len(pairs) == 0
 
-    def test_returns_sorted_by_episode(self, tmp_path):
+    def test_returns_sorted_by_episode(self):
         """Should return pairs sorted by episode number."""
-        video_dir = tmp_path / "videos"
-        video_dir.mkdir()
-        videos = []
-        for n in [10, 2, 1]:
-            v = video_dir / f"ep{n:02d}.mp4"
-            v.touch()
-            videos.append(v)
-
-        sub_dir = tmp_path / "subs"
-        sub_dir.mkdir()
-        subs = []
-        for n in [10, 2, 1]:
-            s = sub_dir / f"sub{n:02d}.ass"
-            s.touch()
-            subs.append(s)
+        videos = [VIDEO_DIR / f"ep{n:02d}.mp4" for n in [10, 2, 1]]
+        subs = [SUB_DIR / f"sub{n:02d}.ass" for n in [10, 2, 1]]
 
         pairs = EpisodeMatcher.match_by_episode_number(videos, subs)
 
@@ -199,26 +162,18 @@ class TestEpisodeMatcher:
         assert "02" in pairs[1][0].name
         assert "10" in pairs[2][0].name
 
-    def test_handles_empty_lists(self, tmp_path):
+    def test_handles_empty_lists(self):
         """Should handle empty file lists."""
-        video = tmp_path / "ep01.mp4"
-        video.touch()
+        video = VIDEO_DIR / "ep01.mp4"
 
         pairs = EpisodeMatcher.match_by_episode_number([video], [])
 
         assert pairs == []
 
-    def test_handles_no_matches(self, tmp_path):
+    def test_handles_no_matches(self):
         """Should return empty list when no matches found."""
-        video_dir = tmp_path / "videos"
-        video_dir.mkdir()
-        video = video_dir / "ep01.mp4"
-        video.touch()
-
-        sub_dir = tmp_path / "subs"
-        sub_dir.mkdir()
-        subtitle = sub_dir / "ep99.ass"  # Different episode
-        subtitle.touch()
+        video = VIDEO_DIR / "ep01.mp4"
+        subtitle = SUB_DIR / "ep99.ass"  # Different episode
 
         pairs = EpisodeMatcher.match_by_episode_number([video], [subtitle])
 
@@ -1,7 +1,13 @@
 """Tests for file_pairing module."""
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from anki_miner.utils.file_pairing import FilePair, FilePairMatcher
 
+pytestmark = pytest.mark.unit
+
 
 class TestFilePair:
     """Tests for FilePair dataclass."""
@@ -28,6 +34,14 @@ class TestFilePair:
 
         assert pair.subtitle_name == "sub.ass"
 
+    def test_is_immutable_and_hashable(self, tmp_path):
+        """Should reject reassignment and be usable as a dict key."""
+        pair = FilePair(tmp_path / "video.mp4", tmp_path / "sub.ass")
+
+        with pytest.raises(FrozenInstanceError):
+            pair.video = tmp_path / "other.mp4"
+        assert {pair: 1}[FilePair(tmp_path / "video.mp4", tmp_path / "sub.ass")] == 1
+
 
 class TestFilePairMatcher:
     """Tests for FilePairMatcher class."""
@@ -86,6 +100,50 @@ class TestFilePairMatcher:
 
             assert len(pairs) == 3
 
+        def test_matches_upper_case_video_extension(self, tmp_path):
+            """Should recognize video extensions regardless of case."""
+            anime_dir = tmp_path / "anime"
+            anime_dir.mkdir()
+            sub_dir = tmp_path / "subs"
+            sub_dir.mkdir()
+
+            (anime_dir / "ep01.MKV").touch()
+            (sub_dir / "ep01.ass").touch()
+
+            pairs = FilePairMatcher.find_pairs_across_folders(anime_dir, sub_dir)
+
+            assert [(p.video_name, p.subtitle_name) for p in pairs] == [("ep01.MKV", "ep01.ass")]
+
+        def test_matches_upper_case_subtitle_extension(self, tmp_path):
+            """Should recognize subtitle extensions regardless of case, like video ones."""
+            anime_dir = tmp_path / "anime"
+            anime_dir.mkdir()
+            sub_dir = tmp_path / "subs"
+            sub_dir.mkdir()
+
+            (anime_dir / "ep01.mkv").touch()
+            (sub_dir / "ep01.ASS").touch()
+
+            pairs = FilePairMatcher.find_pairs_across_folders(anime_dir, sub_dir)
+
+            assert [p.subtitle_name for p in pairs] == ["ep01.ASS"]
+
+        def test_prefers_first_subtitle_extension_alphabetically(self, tmp_path):
+            """Should pick the same subtitle every run when several share a base name."""
+            anime_dir = tmp_path / "anime"
+            anime_dir.mkdir()
+            sub_dir = tmp_path / "subs"
+            sub_dir.mkdir()
+
+            (anime_dir / "ep01.mkv").touch()
+            (sub_dir / "ep01.srt").touch()
+            (sub_dir / "ep01.ass").touch()
+            (sub_dir / "ep01.ssa").touch()
+
+            pairs = FilePairMatcher.find_pairs_across_folders(anime_dir, sub_dir)
+
+            assert [p.subtitle_name for p in pairs] == ["ep01.ass"]
+
         def test_returns_naturally_sorted(self, tmp_path):
             """Should return pairs naturally sorted by video name."""
             anime_dir = tmp_path / "anime"
@@ -4,6 +4,8 @@ import pytest
 
 from anki_miner.utils.file_utils import cleanup_temp_files, ensure_directory, safe_filename
 
+pytestmark = pytest.mark.unit
+
 
 class TestEnsureDirectory:
     """Tests for ensure_directory function."""
@@ -91,6 +93,23 @@ class TestCleanupTempFiles:
         count = cleanup_temp_files(tmp_path, "*.tmp")
         assert count == 0
 
+    @pytest.mark.parametrize(
+        "pattern, expected_removed",
+        [("subdir/*.tmp", {"subdir/nested.tmp"}), ("**/*.tmp", {"top.tmp", "subdir/nested.tmp"})],
+        ids=["nested", "recursive"],
+    )
+    def test_patterns_with_path_components_use_glob(self, tmp_path, pattern, expected_removed):
+        """Should match patterns with a separator or ** the way Path.glob does."""
+        (tmp_path / "subdir").mkdir()
+        files = {"top.tmp", "subdir/nested.tmp", "subdir/keep.txt"}
+        for name in files:
+            (tmp_path / name).write_text("temp")
+
+        count = cleanup_temp_files(tmp_path, pattern)
+
+        assert count == len(expected_removed)
+        assert {name for name in files if (tmp_path / name).exists()} == files - expected_removed
+
 
 class TestSafeFilename:
     """Tests for safe_filename function."""
@@ -124,6 +143,10 @@ class TestSafeFilename:
         """Should replace unsafe filesystem characters with underscore."""
         assert safe_filename(input_str) == expected
 
+    def test_removes_control_characters(self):
+        """Should drop control characters while replacing invalid ones."""
+        assert safe_filename("a\x00b\tc<d\x7f.txt") == "abc_d.txt"
+
     def test_preserves_safe_characters(self):
         """Should preserve safe characters."""
         safe_name = "valid_filename-123.txt"
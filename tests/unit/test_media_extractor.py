@@ -1,14 +1,16 @@
 """Tests for media_extractor module."""
 
-import json
 import subprocess
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from anki_miner.services.media_extractor import MediaExtractorService
 
+pytestmark = pytest.mark.unit
+
 MODULE = "anki_miner.services.media_extractor"
 
 
@@ -28,16 +30,19 @@ def video_file(tmp_path):
 class TestExtractMedia:
     """Tests for extract_media method."""
 
+    @pytest.fixture(autouse=True)
+    def _with_audio_stream(self, service):
+        """Take the combined extraction path without probing the fake video."""
+        with patch.object(service, "_has_audio_stream", return_value=True):
+            yield
+
     def test_success_both_screenshot_and_audio(
         self, service, video_file, make_tokenized_word, test_config
     ):
         """Should return MediaData with both paths when both extractions succeed."""
         word = make_tokenized_word(lemma="食べる", start_time=1.0, duration=2.0)
 
-        with (
-            patch.object(service, "_extract_screenshot", return_value=True),
-            patch.object(service, "_extract_audio", return_value=True),
-        ):
+        with patch.object(service, "_extract_both", return_value=(True, True)):
             result = service.extract_media(video_file, word)
 
         assert result.screenshot_path is not None
@@ -45,11 +50,14 @@ class TestExtractMedia:
         assert result.screenshot_filename is not None
         assert result.audio_filename is not None
 
-    def test_screenshot_only_when_audio_fails(self, service, video_file, make_tokenized_word):
-        """Should return screenshot path only when audio extraction fails."""
+    def test_screenshot_only_when_fallback_audio_fails(
+        self, service, video_file, make_tokenized_word
+    ):
+        """Should return screenshot path only when the separate audio retry also fails."""
         word = make_tokenized_word()
 
         with (
+            patch.object(service, "_extract_both", return_value=(False, False)),
             patch.object(service, "_extract_screenshot", return_value=True),
             patch.object(service, "_extract_audio", return_value=False),
         ):
@@ -60,11 +68,14 @@ class TestExtractMedia:
         assert result.audio_path is None
         assert result.audio_filename is None
 
-    def test_audio_only_when_screenshot_fails(self, service, video_file, make_tokenized_word):
-        """Should return audio path only when screenshot extraction fails."""
+    def test_audio_only_when_fallback_screenshot_fails(
+        self, service, video_file, make_tokenized_word
+    ):
+        """Should return audio path only when the separate screenshot retry also fails."""
         word = make_tokenized_word()
 
         with (
+            patch.object(service, "_extract_both", return_value=(False, False)),
             patch.object(service, "_extract_screenshot", return_value=False),
             patch.object(service, "_extract_audio", return_value=True),
         ):
@@ -79,10 +90,7 @@ class TestExtractMedia:
         """Should generate filenames as {safe_lemma}_{timestamp_ms}.ext."""
         word = make_tokenized_word(lemma="食べる", start_time=1.5, duration=2.0)
 
-        with (
-            patch.object(service, "_extract_screenshot", return_value=True),
-            patch.object(service, "_extract_audio", return_value=True),
-        ):
+        with patch.object(service, "_extract_both", return_value=(True, True)):
             result = service.extract_media(video_file, word)
 
         # 1.5 * 1000 = 1500
@@ -93,16 +101,171 @@ class TestExtractMedia:
         """Should sanitize filenames by replacing unsafe characters."""
         word = make_tokenized_word(lemma='te<st>:wo"rd', start_time=2.0, duration=1.0)
 
-        with (
-            patch.object(service, "_extract_screenshot", return_value=True),
-            patch.object(service, "_extract_audio", return_value=True),
-        ):
+        with patch.object(service, "_extract_both", return_value=(True, True)):
             result = service.extract_media(video_file, word)
 
         # safe_filename replaces <, >, :, " with underscores
         assert result.screenshot_filename == "te_st__wo_rd_2000.jpg"
         assert result.audio_filename == "te_st__wo_rd_2000.mp3"
 
+    def test_single_ffmpeg_run_when_combined_extraction_succeeds(
+        self, service, video_file, make_tokenized_word
+    ):
+        """Should not run the separate extractors when the combined run produced both."""
+        word = make_tokenized_word()
+
+        with (
+            patch.object(service, "_extract_both", return_value=(True, True)),
+            patch.object(service, "_extract_screenshot") as mock_screenshot,
+            patch.object(service, "_extract_audio") as mock_audio,
+        ):
+            result = service.extract_media(video_file, word)
+
+        assert result.screenshot_path is not None
+        assert result.audio_path is not None
+        mock_screenshot.assert_not_called()
+        mock_audio.assert_not_called()
+
+    def test_retries_only_the_missing_output(self, service, video_file, make_tokenized_word):
+        """Should fall back to a separate run only for the output the combined run missed."""
+        word = make_tokenized_word()
+
+        with (
+            patch.object(service, "_extract_both", return_value=(True, False)),
+            patch.object(service, "_extract_screenshot") as mock_screenshot,
+            patch.object(service, "_extract_audio", return_value=True) as mock_audio,
+        ):
+            result = service.extract_media(video_file, word)
+
+        assert result.screenshot_path is not None
+        assert result.audio_path is not None
+        mock_screenshot.assert_not_called()
+        mock_audio.assert_called_once()
+
+
+class TestExtractBoth:
+    """Tests for _extract_both method."""
+
+    def test_single_ffmpeg_command_for_both_outputs(self, service, video_file, tmp_path):
+        """Should seek the input once and write the screenshot and audio from one process."""
+        screenshot_path = tmp_path / "shot.jpg"
+        audio_path = tmp_path / "clip.mp3"
+        # audio_start = 5.0 - 0.3 = 4.7; screenshot_time = 5.0 + min(1.0, 4.0/2) = 6.0
+        mock_proc = MagicMock()
+        mock_proc.returncode = 0
+
+        with (
+            patch(f"{MODULE}.subprocess.run", return_value=mock_proc) as mock_run,
+            patch.object(service, "_get_japanese_audio_stream", return_value=2),
+            patch.object(Path, "exists", return_value=True),
+        ):
+            result = service._extract_both(video_file, 5.0, 4.0, screenshot_path, audio_path)
+
+        assert result == (True, True)
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        input_index = cmd.index("-i")
+        assert cmd[cmd.index("-ss") + 1] == str(4.7)
+        assert cmd[input_index + 1] == str(video_file)
+        screenshot_index = cmd.index(str(screenshot_path))
+        screenshot_args = cmd[input_index + 2 : screenshot_index]
+        assert screenshot_args[screenshot_args.index("-ss") + 1] == str(6.0 - 4.7)
+        assert screenshot_args[screenshot_args.index("-map") + 1] == "0:V:0"
+        assert screenshot_args[screenshot_args.index("-frames:v") + 1] == "1"
+        audio_args = cmd[screenshot_index + 1 :]
+        assert audio_args[audio_args.index("-map") + 1] == "0:2"
+        assert audio_args[audio_args.index("-t") + 1] == str(4.0 + 0.3 * 2)
+        assert cmd[-1] == str(audio_path)
+
+    def test_returns_false_for_both_on_nonzero_exit(self, service, video_file, tmp_path):
+        """Should report both outputs as failed when ffmpeg exits non-zero."""
+        mock_proc = MagicMock()
+        mock_proc.returncode = 1
+
+        with (
+            patch(f"{MODULE}.subprocess.run", return_value=mock_proc),
+            patch.object(service, "_get_japanese_audio_stream", return_value=None),
+        ):
+            result = service._extract_both(
+                video_file, 5.0, 2.0, tmp_path / "shot.jpg", tmp_path / "clip.mp3"
+            )
+
+        assert result == (False, False)
+
+    def test_reports_each_output_separately(self, service, video_file, tmp_path):
+        """Should report success per output based on which files were written."""
+        screenshot_path = tmp_path / "shot.jpg"
+        screenshot_path.touch()
+        mock_proc = MagicMock()
+        mock_proc.returncode = 0
+
+        with (
+            patch(f"{MODULE}.subprocess.run", return_value=mock_proc),
+            patch.object(service, "_get_japanese_audio_stream", return_value=None),
+        ):
+            result = service._extract_both(
+                video_file, 5.0, 2.0, screenshot_path, tmp_path / "clip.mp3"
+            )
+
+        assert result == (True, False)
+
+    def test_returns_none_on_timeout(self, service, video_file, tmp_path):
+        """Should signal a timeout separately from an ordinary failure."""
+        with (
+            patch(
+                f"{MODULE}.subprocess.run",
+                side_effect=subprocess.TimeoutExpired(cmd="ffmpeg", timeout=30),
+            ),
+            patch.object(service, "_get_japanese_audio_stream", return_value=None),
+        ):
+            result = service._extract_both(
+                video_file, 5.0, 2.0, tmp_path / "shot.jpg", tmp_path / "clip.mp3"
+            )
+
+        assert result is None
+
+    def test_no_separate_retries_after_timeout(self, service, video_file, make_tokenized_word):
+        """Should spawn ffmpeg once per word when the combined run times out."""
+        word = make_tokenized_word()
+
+        with (
+            patch(
+                f"{MODULE}.subprocess.run",
+                side_effect=subprocess.TimeoutExpired(cmd="ffmpeg", timeout=30),
+            ) as mock_run,
+            patch.object(service, "_has_audio_stream", return_value=True),
+            patch.object(service, "_get_japanese_audio_stream", return_value=None),
+        ):
+            result = service.extract_media(video_file, word)
+
+        assert mock_run.call_count == 1
+        assert result.screenshot_path is None
+        assert result.audio_path is None
+
+    def test_screenshot_only_run_when_video_has_no_audio(
+        self, service, video_file, make_tokenized_word
+    ):
+        """Should skip the combined run and spawn one screenshot-only ffmpeg."""
+        word = make_tokenized_word()
+        probe = MagicMock(returncode=0, stdout="")  # ffprobe lists no audio streams
+        ffmpeg = MagicMock(returncode=0)
+
+        with (
+            patch(f"{MODULE}._HAS_AV", False),
+            patch(
+                f"{MODULE}.subprocess.run",
+                side_effect=lambda cmd, **kwargs: probe if cmd[0] == "ffprobe" else ffmpeg,
+            ) as mock_run,
+            patch.object(Path, "exists", return_value=True),
+        ):
+            result = service.extract_media(video_file, word)
+
+        ffmpeg_cmds = [c.args[0] for c in mock_run.call_args_list if c.args[0][0] == "ffmpeg"]
+        assert len(ffmpeg_cmds) == 1
+        assert "-vn" not in ffmpeg_cmds[0]
+        assert result.screenshot_path is not None
+        assert result.audio_path is None
+
 
 class TestExtractScreenshot:
     """Tests for _extract_screenshot method."""
@@ -128,6 +291,7 @@ class TestExtractScreenshot:
         cmd = mock_run.call_args[0][0]
         assert cmd[0] == "ffmpeg"
         assert "-y" in cmd
+        assert cmd[cmd.index("-threads") + 1] == "1"
         assert cmd[cmd.index("-ss") + 1] == str(expected_time)
         assert cmd[cmd.index("-i") + 1] == str(video_file)
         assert "-frames:v" in cmd
@@ -136,6 +300,23 @@ class TestExtractScreenshot:
         assert cmd[cmd.index("-q:v") + 1] == "2"
         assert cmd[-1] == str(output_path)
 
+    def test_default_threading_without_parallel_workers(self, test_config, video_file, tmp_path):
+        """Should leave ffmpeg's thread count alone when only one worker runs."""
+        from dataclasses import replace
+
+        with patch(f"{MODULE}.ensure_directory"):
+            service = MediaExtractorService(replace(test_config, max_parallel_workers=1))
+        mock_proc = MagicMock()
+        mock_proc.returncode = 0
+
+        with (
+            patch(f"{MODULE}.subprocess.run", return_value=mock_proc) as mock_run,
+            patch.object(Path, "exists", return_value=True),
+        ):
+            service._extract_screenshot(video_file, 5.0, 4.0, tmp_path / "output.jpg")
+
+        assert "-threads" not in mock_run.call_args[0][0]
+
     def test_screenshot_time_uses_half_duration_when_offset_larger(
         self, service, video_file, tmp_path
     ):
@@ -244,6 +425,7 @@ class TestExtractAudio:
         assert cmd[cmd.index("-ss") + 1] == str(4.7)
         # audio_duration = 2.0 + (0.3 * 2) = 2.6
         assert cmd[cmd.index("-t") + 1] == str(2.6)
+        assert cmd[cmd.index("-threads") + 1] == "1"
 
     def test_start_clamped_to_zero(self, service, video_file, tmp_path):
         """Should clamp audio start to 0 when start_time - padding < 0."""
@@ -299,6 +481,23 @@ class TestExtractAudio:
         map_index = cmd.index("-map")
         assert cmd[map_index + 1] == "0:a:0"
 
+    def test_stream_copies_into_source_container(self, service, video_file, tmp_path):
+        """Should copy the audio stream instead of encoding MP3 for .m4a output."""
+        output_path = tmp_path / "output.m4a"
+
+        mock_proc = MagicMock()
+        mock_proc.returncode = 0
+
+        with (
+            patch(f"{MODULE}.subprocess.run", return_value=mock_proc) as mock_run,
+            patch.object(service, "_get_japanese_audio_stream", return_value=None),
+        ):
+            service._extract_audio(video_file, 1.0, 2.0, output_path)
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-c:a") + 1] == "copy"
+        assert "libmp3lame" not in cmd
+
     def test_returns_false_on_nonzero_exit(self, service, video_file, tmp_path):
         """Should return False when ffmpeg exits with non-zero code."""
         output_path = tmp_path / "output.mp3"
@@ -334,22 +533,29 @@ class TestExtractAudio:
 class TestGetJapaneseAudioStream:
     """Tests for _get_japanese_audio_stream method."""
 
+    @pytest.fixture(autouse=True)
+    def _without_pyav(self):
+        """Exercise the ffprobe path regardless of whether PyAV is installed."""
+        with patch(f"{MODULE}._HAS_AV", False):
+            yield
+
     def _make_ffprobe_output(self, streams):
-        """Helper to build ffprobe JSON output with the given stream descriptors.
+        """Helper to build ffprobe CSV output with the given stream descriptors.
 
-        Each stream should be a dict with at least 'index' and 'language' keys.
+        Each stream should be a dict with at least 'index' and 'language' keys,
+        and optionally 'codec' (defaults to aac).
         """
-        stream_list = []
+        lines = []
         for s in streams:
-            entry = {"index": s["index"], "codec_type": "audio", "tags": {}}
+            fields = [str(s["index"]), s.get("codec", "aac")]
             if "language" in s:
-                entry["tags"]["language"] = s["language"]
-            stream_list.append(entry)
-        return json.dumps({"streams": stream_list})
+                fields.append(s["language"])
+            lines.append(",".join(fields))
+        return "\n".join(lines) + "\n"
 
     def test_returns_stream_index_when_japanese_found(self, service, video_file):
         """Should return the index of the Japanese audio stream."""
-        ffprobe_json = self._make_ffprobe_output(
+        ffprobe_output = self._make_ffprobe_output(
             [
                 {"index": 0, "language": "eng"},
                 {"index": 1, "language": "jpn"},
@@ -358,7 +564,7 @@ class TestGetJapaneseAudioStream:
 
         mock_proc = MagicMock()
         mock_proc.returncode = 0
-        mock_proc.stdout = ffprobe_json
+        mock_proc.stdout = ffprobe_output
 
         with patch(f"{MODULE}.subprocess.run", return_value=mock_proc):
             result = service._get_japanese_audio_stream(video_file)
@@ -367,7 +573,7 @@ class TestGetJapaneseAudioStream:
 
     def test_returns_none_when_no_japanese_stream(self, service, video_file):
         """Should return None when no Japanese audio stream exists."""
-        ffprobe_json = self._make_ffprobe_output(
+        ffprobe_output = self._make_ffprobe_output(
             [
                 {"index": 0, "language": "eng"},
                 {"index": 1, "language": "fre"},
@@ -376,7 +582,7 @@ class TestGetJapaneseAudioStream:
 
         mock_proc = MagicMock()
         mock_proc.returncode = 0
-        mock_proc.stdout = ffprobe_json
+        mock_proc.stdout = ffprobe_output
 
         with patch(f"{MODULE}.subprocess.run", return_value=mock_proc):
             result = service._get_japanese_audio_stream(video_file)
@@ -385,7 +591,7 @@ class TestGetJapaneseAudioStream:
 
     def test_caches_result_for_same_video_file(self, service, video_file):
         """Should cache the result and not call ffprobe again for same file."""
-        ffprobe_json = self._make_ffprobe_output(
+        ffprobe_output = self._make_ffprobe_output(
             [
                 {"index": 0, "language": "jpn"},
             ]
@@ -393,7 +599,7 @@ class TestGetJapaneseAudioStream:
 
         mock_proc = MagicMock()
         mock_proc.returncode = 0
-        mock_proc.stdout = ffprobe_json
+        mock_proc.stdout = ffprobe_output
 
         with patch(f"{MODULE}.subprocess.run", return_value=mock_proc) as mock_run:
             first = service._get_japanese_audio_stream(video_file)
@@ -414,13 +620,38 @@ class TestGetJapaneseAudioStream:
 
         assert result is None
         assert video_file in service._audio_stream_cache
+        # An unknown stream layout still attempts audio extraction
+        assert service._has_audio_stream(video_file) is True
+
+    @pytest.mark.parametrize(
+        ("streams", "expected_codec"),
+        [
+            (
+                [{"index": 0, "language": "eng", "codec": "ac3"}, {"index": 1, "language": "jpn"}],
+                "aac",
+            ),
+            ([{"index": 0, "language": "eng", "codec": "opus"}], "opus"),
+            ([{"index": 0, "codec": "opus"}], "opus"),
+        ],
+        ids=["japanese_stream", "first_stream_fallback", "untagged_stream"],
+    )
+    def test_records_codec_of_extracted_stream(self, service, video_file, streams, expected_codec):
+        """Should record the codec of the stream that extraction will map."""
+        mock_proc = MagicMock()
+        mock_proc.returncode = 0
+        mock_proc.stdout = self._make_ffprobe_output(streams)
+
+        with patch(f"{MODULE}.subprocess.run", return_value=mock_proc):
+            service._get_japanese_audio_stream(video_file)
+
+        assert service._audio_codec_cache[video_file] == expected_codec
 
     @pytest.mark.parametrize("lang_code", ["jpn", "ja", "japanese", "jp"])
     def test_detects_all_japanese_language_codes(self, service, tmp_path, lang_code):
         """Should detect Japanese audio for all recognized language codes."""
         # Use a unique video file per parametrize invocation to avoid cache
         vid = tmp_path / f"video_{lang_code}.mkv"
-        ffprobe_json = self._make_ffprobe_output(
+        ffprobe_output = self._make_ffprobe_output(
             [
                 {"index": 3, "language": lang_code},
             ]
@@ -428,13 +659,91 @@ class TestGetJapaneseAudioStream:
 
         mock_proc = MagicMock()
         mock_proc.returncode = 0
-        mock_proc.stdout = ffprobe_json
+        mock_proc.stdout = ffprobe_output
 
         with patch(f"{MODULE}.subprocess.run", return_value=mock_proc):
             result = service._get_japanese_audio_stream(vid)
 
         assert result == 3
 
+    class TestWithPyAV:
+        """Tests for the in-process PyAV probing path."""
+
+        @staticmethod
+        def _make_av(streams):
+            """Build a stand-in av module whose container exposes the given audio streams."""
+            container = MagicMock()
+            container.streams.audio = [
+                SimpleNamespace(
+                    index=s["index"],
+                    codec_context=SimpleNamespace(name=s.get("codec", "aac")),
+                    metadata={"language": s["language"]} if "language" in s else {},
+                )
+                for s in streams
+            ]
+            fake_av = MagicMock()
+            fake_av.open.return_value.__enter__.return_value = container
+            return fake_av
+
+        def test_returns_japanese_stream_without_ffprobe(self, service, video_file):
+            """Should read stream languages in-process and never spawn ffprobe."""
+            fake_av = self._make_av(
+                [{"index": 1, "language": "eng"}, {"index": 2, "language": "JPN", "codec": "opus"}]
+            )
+
+            with (
+                patch(f"{MODULE}._HAS_AV", True),
+                patch(f"{MODULE}.av", fake_av, create=True),
+                patch(f"{MODULE}.subprocess.run") as mock_run,
+            ):
+                result = service._get_japanese_audio_stream(video_file)
+
+            assert result == 2
+            assert service._audio_codec_cache[video_file] == "opus"
+            mock_run.assert_not_called()
+
+        def test_returns_none_when_container_cannot_be_opened(self, service, video_file):
+            """Should return None and cache when PyAV fails to open the file."""
+            fake_av = MagicMock()
+            fake_av.open.side_effect = OSError("invalid data")
+
+            with (
+                patch(f"{MODULE}._HAS_AV", True),
+                patch(f"{MODULE}.av", fake_av, create=True),
+            ):
+                result = service._get_japanese_audio_stream(video_file)
+
+            assert result is None
+            assert video_file in service._audio_stream_cache
+
+
+class TestAudioExtension:
+    """Tests for _audio_extension method."""
+
+    def test_mp3_without_probing_when_stream_copy_disabled(self, service, video_file):
+        """Should keep MP3 output and skip ffprobe when stream copy is off."""
+        with patch.object(service, "_get_japanese_audio_stream") as mock_probe:
+            assert service._audio_extension(video_file) == ".mp3"
+
+        mock_probe.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("codec", "expected"),
+        [("aac", ".m4a"), ("opus", ".opus"), ("flac", ".mp3"), (None, ".mp3")],
+    )
+    def test_matches_source_codec_when_stream_copy_enabled(
+        self, test_config, video_file, codec, expected
+    ):
+        """Should pick the source container for copyable codecs, else fall back to MP3."""
+        from dataclasses import replace
+
+        with patch(f"{MODULE}.ensure_directory"):
+            service = MediaExtractorService(replace(test_config, audio_stream_copy=True))
+        service._audio_codec_cache[video_file] = codec
+
+        with patch.object(service, "_get_japanese_audio_stream"):
+            assert service._audio_extension(video_file) == expected
+
 
 class TestExtractMediaBatch:
     """Tests for extract_media_batch method."""
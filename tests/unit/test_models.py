@@ -1,164 +1,121 @@
 """Tests for data model classes."""
 
+from pathlib import Path
+
+import pytest
+
 from anki_miner.models.media import MediaData
 from anki_miner.models.processing import ProcessingResult, ValidationIssue, ValidationResult
-from anki_miner.models.word import TokenizedWord, WordData
+from anki_miner.models.word import WordData
+
+pytestmark = pytest.mark.unit
 
 
 class TestTokenizedWord:
     """Tests for TokenizedWord dataclass."""
 
-    def test_basic_creation(self):
-        word = TokenizedWord(
-            surface="食べる",
-            lemma="食べる",
-            reading="タベル",
-            sentence="日本語を食べる。",
-            start_time=1.0,
-            end_time=3.0,
-            duration=2.0,
-        )
-        assert word.surface == "食べる"
-        assert word.lemma == "食べる"
-        assert word.video_file is None
-
-    def test_with_video_file(self, tmp_path):
-        video = tmp_path / "ep01.mkv"
-        word = TokenizedWord(
-            surface="走る",
-            lemma="走る",
-            reading="ハシル",
-            sentence="走る。",
-            start_time=0.0,
-            end_time=1.0,
-            duration=1.0,
-            video_file=video,
-        )
-        assert word.video_file == video
-
-    def test_str_shows_lemma_and_reading(self):
-        word = TokenizedWord(
-            surface="食べた",
-            lemma="食べる",
-            reading="タベル",
-            sentence="",
-            start_time=0,
-            end_time=0,
-            duration=0,
-        )
+    @pytest.mark.parametrize(
+        "overrides, attr, expected",
+        [
+            ({}, "surface", "食べる"),
+            ({}, "lemma", "食べる"),
+            ({}, "video_file", None),
+            ({"video_file": Path("ep01.mkv")}, "video_file", Path("ep01.mkv")),
+            ({}, "expression_furigana", ""),
+            ({}, "sentence_furigana", ""),
+            ({"expression_furigana": " 食べる[たべる]"}, "expression_furigana", " 食べる[たべる]"),
+            (
+                {"sentence_furigana": " 日本語[にほんご]を 食べる[たべる]。"},
+                "sentence_furigana",
+                " 日本語[にほんご]を 食べる[たべる]。",
+            ),
+        ],
+        ids=[
+            "surface",
+            "lemma",
+            "video_file_default_none",
+            "video_file_set",
+            "expression_furigana_default_empty",
+            "sentence_furigana_default_empty",
+            "expression_furigana_set",
+            "sentence_furigana_set",
+        ],
+    )
+    def test_attributes(self, make_tokenized_word, overrides, attr, expected):
+        word = make_tokenized_word(**overrides)
+        assert getattr(word, attr) == expected
+
+    def test_str_shows_lemma_and_reading(self, make_tokenized_word):
+        word = make_tokenized_word(surface="食べた")
         assert "食べる" in str(word)
         assert "タベル" in str(word)
 
-    def test_repr(self):
-        word = TokenizedWord(
-            surface="走った",
-            lemma="走る",
-            reading="ハシル",
-            sentence="",
-            start_time=0,
-            end_time=0,
-            duration=0,
-        )
+    def test_repr(self, make_tokenized_word):
+        word = make_tokenized_word(surface="走った", lemma="走る", reading="ハシル")
         r = repr(word)
         assert "走る" in r
         assert "走った" in r
 
-    def test_furigana_fields_default_empty(self):
-        word = TokenizedWord(
-            surface="食べる",
-            lemma="食べる",
-            reading="タベル",
-            sentence="",
-            start_time=0,
-            end_time=0,
-            duration=0,
-        )
-        assert word.expression_furigana == ""
-        assert word.sentence_furigana == ""
-
-    def test_furigana_fields_set_correctly(self):
-        word = TokenizedWord(
-            surface="食べる",
-            lemma="食べる",
-            reading="タベル",
-            sentence="日本語を食べる。",
-            start_time=0,
-            end_time=0,
-            duration=0,
-            expression_furigana=" 食べる[たべる]",
-            sentence_furigana=" 日本語[にほんご]を 食べる[たべる]。",
-        )
-        assert word.expression_furigana == " 食べる[たべる]"
-        assert word.sentence_furigana == " 日本語[にほんご]を 食べる[たべる]。"
-
 
 class TestWordData:
     """Tests for WordData dataclass."""
 
-    def _make_word(self):
-        return TokenizedWord(
-            surface="食べる",
-            lemma="食べる",
-            reading="タベル",
-            sentence="",
-            start_time=0,
-            end_time=0,
-            duration=0,
-        )
-
-    def test_has_media_with_screenshot(self, tmp_path):
+    def test_has_media_with_screenshot(self, make_tokenized_word):
         wd = WordData(
-            word=self._make_word(),
-            screenshot_path=tmp_path / "ss.jpg",
+            word=make_tokenized_word(),
+            screenshot_path=Path("ss.jpg"),
         )
         assert wd.has_media is True
 
-    def test_has_media_with_audio(self, tmp_path):
+    def test_has_media_with_audio(self, make_tokenized_word):
         wd = WordData(
-            word=self._make_word(),
-            audio_path=tmp_path / "au.mp3",
+            word=make_tokenized_word(),
+            audio_path=Path("au.mp3"),
         )
         assert wd.has_media is True
 
-    def test_has_media_false_when_none(self):
-        wd = WordData(word=self._make_word())
+    def test_has_media_false_when_none(self, make_tokenized_word):
+        wd = WordData(word=make_tokenized_word())
         assert wd.has_media is False
 
-    def test_has_definition_true(self):
-        wd = WordData(word=self._make_word(), definition="to eat")
+    def test_has_definition_true(self, make_tokenized_word):
+        wd = WordData(word=make_tokenized_word(), definition="to eat")
         assert wd.has_definition is True
 
-    def test_has_definition_false_when_none(self):
-        wd = WordData(word=self._make_word(), definition=None)
+    def test_has_definition_false_when_none(self, make_tokenized_word):
+        wd = WordData(word=make_tokenized_word(), definition=None)
         assert wd.has_definition is False
 
-    def test_has_definition_false_when_empty(self):
-        wd = WordData(word=self._make_word(), definition="")
+    def test_has_definition_false_when_empty(self, make_tokenized_word):
+        wd = WordData(word=make_tokenized_word(), definition="")
         assert wd.has_definition is False
 
-    def test_str_with_definition(self):
-        wd = WordData(word=self._make_word(), definition="to eat food")
+    def test_str_with_definition(self, make_tokenized_word):
+        wd = WordData(word=make_tokenized_word(), definition="to eat food")
         s = str(wd)
         assert "食べる" in s
         assert "to eat" in s
 
-    def test_str_without_definition(self):
-        wd = WordData(word=self._make_word())
+    def test_str_without_definition(self, make_tokenized_word):
+        wd = WordData(word=make_tokenized_word())
         assert "No definition" in str(wd)
 
 
 class TestMediaData:
     """Tests for MediaData dataclass."""
 
-    def test_has_screenshot_with_real_file(self, tmp_path):
-        ss = tmp_path / "screenshot.jpg"
-        ss.write_bytes(b"fake")
-        md = MediaData(screenshot_path=ss, screenshot_filename="screenshot.jpg")
+    @pytest.fixture
+    def fake_exists(self, monkeypatch):
+        """Make every path report that it exists, so tests need not write files."""
+        monkeypatch.setattr(Path, "exists", lambda self: True)
+
+    def test_has_screenshot_when_file_exists(self, fake_exists):
+        md = MediaData(screenshot_path=Path("screenshot.jpg"), screenshot_filename="screenshot.jpg")
         assert md.has_screenshot is True
 
-    def test_has_screenshot_false_missing_file(self, tmp_path):
+    def test_has_screenshot_false_missing_file(self):
         md = MediaData(
-            screenshot_path=tmp_path / "nonexistent.jpg",
+            screenshot_path=Path("nonexistent.jpg"),
             screenshot_filename="nonexistent.jpg",
         )
         assert md.has_screenshot is False
@@ -167,37 +124,29 @@ class TestMediaData:
         md = MediaData()
         assert md.has_screenshot is False
 
-    def test_has_audio_with_real_file(self, tmp_path):
-        au = tmp_path / "audio.mp3"
-        au.write_bytes(b"fake")
-        md = MediaData(audio_path=au, audio_filename="audio.mp3")
+    def test_has_audio_when_file_exists(self, fake_exists):
+        md = MediaData(audio_path=Path("audio.mp3"), audio_filename="audio.mp3")
         assert md.has_audio is True
 
-    def test_has_audio_false_missing_file(self, tmp_path):
+    def test_has_audio_false_missing_file(self):
         md = MediaData(
-            audio_path=tmp_path / "nonexistent.mp3",
+            audio_path=Path("nonexistent.mp3"),
             audio_filename="nonexistent.mp3",
         )
         assert md.has_audio is False
 
-    def test_has_any_media_true(self, tmp_path):
-        ss = tmp_path / "ss.jpg"
-        ss.write_bytes(b"fake")
-        md = MediaData(screenshot_path=ss, screenshot_filename="ss.jpg")
+    def test_has_any_media_true(self, fake_exists):
+        md = MediaData(screenshot_path=Path("ss.jpg"), screenshot_filename="ss.jpg")
         assert md.has_any_media is True
 
     def test_has_any_media_false(self):
         md = MediaData()
         assert md.has_any_media is False
 
-    def test_str_with_media(self, tmp_path):
-        ss = tmp_path / "ss.jpg"
-        ss.write_bytes(b"fake")
-        au = tmp_path / "au.mp3"
-        au.write_bytes(b"fake")
+    def test_str_with_media(self, fake_exists):
         md = MediaData(
-            screenshot_path=ss,
-            audio_path=au,
+            screenshot_path=Path("ss.jpg"),
+            audio_path=Path("au.mp3"),
             screenshot_filename="ss.jpg",
             audio_filename="au.mp3",
         )
@@ -265,32 +214,19 @@ class TestValidationIssue:
 class TestValidationResult:
     """Tests for ValidationResult dataclass."""
 
-    def test_all_passed_true(self):
-        result = ValidationResult(
-            ankiconnect_ok=True,
-            ffmpeg_ok=True,
-            deck_exists=True,
-            note_type_exists=True,
-        )
-        assert result.all_passed is True
-
-    def test_all_passed_false_ankiconnect(self):
-        result = ValidationResult(
-            ankiconnect_ok=False,
-            ffmpeg_ok=True,
-            deck_exists=True,
-            note_type_exists=True,
-        )
-        assert result.all_passed is False
-
-    def test_all_passed_false_ffmpeg(self):
+    @pytest.mark.parametrize(
+        "ankiconnect_ok, ffmpeg_ok, expected_all_passed",
+        [(True, True, True), (False, True, False), (True, False, False)],
+        ids=["all_ok", "ankiconnect_failed", "ffmpeg_failed"],
+    )
+    def test_all_passed(self, ankiconnect_ok, ffmpeg_ok, expected_all_passed):
         result = ValidationResult(
-            ankiconnect_ok=True,
-            ffmpeg_ok=False,
+            ankiconnect_ok=ankiconnect_ok,
+            ffmpeg_ok=ffmpeg_ok,
             deck_exists=True,
             note_type_exists=True,
         )
-        assert result.all_passed is False
+        assert result.all_passed is expected_all_passed
 
     def test_has_errors(self):
         result = ValidationResult(
@@ -323,52 +259,46 @@ class TestValidationResult:
         assert result.has_warnings is False
 
     def test_get_errors(self):
-        issues = [
-            ValidationIssue("A", "ERROR", "msg1"),
-            ValidationIssue("B", "WARNING", "msg2"),
-            ValidationIssue("C", "ERROR", "msg3"),
-        ]
         result = ValidationResult(
             ankiconnect_ok=False,
             ffmpeg_ok=False,
             deck_exists=True,
             note_type_exists=True,
-            issues=issues,
+            issues=[
+                ValidationIssue("AnkiConnect", "ERROR", "Connection failed"),
+                ValidationIssue("Temp Folder", "WARNING", "Could not create"),
+                ValidationIssue("FFmpeg", "ERROR", "Not found"),
+            ],
         )
         errors = result.get_errors()
         assert len(errors) == 2
         assert all(e.severity == "ERROR" for e in errors)
 
     def test_get_warnings(self):
-        issues = [
-            ValidationIssue("A", "ERROR", "msg1"),
-            ValidationIssue("B", "WARNING", "msg2"),
-        ]
         result = ValidationResult(
             ankiconnect_ok=False,
             ffmpeg_ok=True,
             deck_exists=True,
             note_type_exists=True,
-            issues=issues,
+            issues=[
+                ValidationIssue("AnkiConnect", "ERROR", "Connection failed"),
+                ValidationIssue("Temp Folder", "WARNING", "Could not create"),
+            ],
         )
         warnings = result.get_warnings()
         assert len(warnings) == 1
-        assert warnings[0].component == "B"
-
-    def test_str_passed(self):
+        assert warnings[0].component == "Temp Folder"
+
+    @pytest.mark.parametrize(
+        "ankiconnect_ok, expected_status",
+        [(True, "PASSED"), (False, "FAILED")],
+        ids=["passed", "failed"],
+    )
+    def test_str_status(self, ankiconnect_ok, expected_status):
         result = ValidationResult(
-            ankiconnect_ok=True,
-            ffmpeg_ok=True,
-            deck_exists=True,
-            note_type_exists=True,
-        )
-        assert "PASSED" in str(result)
-
-    def test_str_failed(self):
-        result = ValidationResult(
-            ankiconnect_ok=False,
+            ankiconnect_ok=ankiconnect_ok,
             ffmpeg_ok=True,
             deck_exists=True,
             note_type_exists=True,
         )
-        assert "FAILED" in str(result)
+        assert expected_status in str(result)
@@ -9,6 +9,8 @@ from anki_miner.config import AnkiMinerConfig
 from anki_miner.exceptions import SubtitleParseError
 from anki_miner.services.subtitle_parser import SubtitleParserService
 
+pytestmark = pytest.mark.unit
+
 # --- Helpers for building mock MeCab tokens ---
 
 
@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock, PropertyMock
 
+import pytest
+
 from anki_miner.utils.text_utils import (
     clean_subtitle_text,
     extract_japanese_text,
@@ -9,6 +11,8 @@ from anki_miner.utils.text_utils import (
     katakana_to_hiragana,
 )
 
+pytestmark = pytest.mark.unit
+
 
 class TestCleanSubtitleText:
     """Tests for clean_subtitle_text function."""
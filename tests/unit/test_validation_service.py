@@ -7,6 +7,8 @@ import pytest
 
 from anki_miner.services.validation_service import ValidationService
 
+pytestmark = pytest.mark.unit
+
 
 class TestValidationService:
     """Tests for ValidationService class."""
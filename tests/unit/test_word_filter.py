@@ -5,6 +5,8 @@ import pytest
 from anki_miner.models.word import TokenizedWord
 from anki_miner.services.word_filter import WordFilterService
 
+pytestmark = pytest.mark.unit
+
 
 def create_word(lemma: str, surface: str = None) -> TokenizedWord:
     """Helper to create a TokenizedWord for testing."""